@@ -14,6 +14,11 @@ from copy import deepcopy
 
 logger = logging.getLogger(__name__)
 
+_reference_re = re.compile(r'\${?(\w+)}?')
+_env_ref_re   = re.compile(r'\$ENV\{(\w+)\}')
+_shell_ref_re = re.compile(r'\$SHELL\{([^}]+)\}')
+_math_re      = re.compile(r'\s[+-/*]\s')
+
 class _Element(object): # private class, don't want users constructing directly or calling methods on it
 
     def __init__(self, xml_element):
@@ -420,11 +425,9 @@ class GenericXML(object):
         >>> obj.get_resolved_value("$SHELL{echo hi}") == 'hi'
         True
         """
-        logger.debug("raw_value {}".format(raw_value))
-        reference_re = re.compile(r'\${?(\w+)}?')
-        env_ref_re   = re.compile(r'\$ENV\{(\w+)\}')
-        shell_ref_re = re.compile(r'\$SHELL\{([^}]+)\}')
-        math_re = re.compile(r'\s[+-/*]\s')
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("raw_value {}".format(raw_value))
         item_data = raw_value
 
         if item_data is None:
@@ -433,8 +436,9 @@ class GenericXML(object):
         if not isinstance(item_data, six.string_types):
             return item_data
 
-        for m in env_ref_re.finditer(item_data):
-            logger.debug("look for {} in env".format(item_data))
+        for m in _env_ref_re.finditer(item_data):
+            if debug:
+                logger.debug("look for {} in env".format(item_data))
             env_var = m.groups()[0]
             env_var_exists = env_var in os.environ
             if not allow_unresolved_envvars:
@@ -442,20 +446,23 @@ class GenericXML(object):
             if env_var_exists:
                 item_data = item_data.replace(m.group(), os.environ[env_var])
 
-        for s in shell_ref_re.finditer(item_data):
-            logger.debug("execute {} in shell".format(item_data))
+        for s in _shell_ref_re.finditer(item_data):
+            if debug:
+                logger.debug("execute {} in shell".format(item_data))
             shell_cmd = s.groups()[0]
             item_data = item_data.replace(s.group(), run_cmd_no_fail(shell_cmd))
 
-        for m in reference_re.finditer(item_data):
+        for m in _reference_re.finditer(item_data):
             var = m.groups()[0]
-            logger.debug("find: {}".format(var))
+            if debug:
+                logger.debug("find: {}".format(var))
             # The overridden versions of this method do not simply return None
             # so the pylint should not be flagging this
             ref = self.get_value(var) # pylint: disable=assignment-from-none
 
             if ref is not None:
-                logger.debug("resolve: " + str(ref))
+                if debug:
+                    logger.debug("resolve: " + str(ref))
                 item_data = item_data.replace(m.group(), self.get_resolved_value(str(ref)))
             elif var == "CIMEROOT":
                 cimeroot = get_cime_root()
@@ -466,7 +473,7 @@ class GenericXML(object):
             elif var == "USER":
                 item_data = item_data.replace(m.group(), getpass.getuser())
 
-        if math_re.search(item_data):
+        if _math_re.search(item_data):
             try:
                 tmp = eval(item_data)
             except:
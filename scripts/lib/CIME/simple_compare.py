@@ -12,7 +12,7 @@ def _normalize_string_value(value, case):
     """
     # Any occurance of case must be normalized because test-ids might not match
     if (case is not None):
-        case_re = re.compile(r'{}[.]([GC])[.]([^./\s]+)'.format(case))
+        case_re = re.compile(r'{}[.]([GC])[.]([^./\s]+)'.format(re.escape(case)))
         value = case_re.sub("{}.ACTION.TESTID".format(case), value)
 
     if ("/" in value):
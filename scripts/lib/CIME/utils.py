@@ -3,7 +3,7 @@ Common functions used by cime python scripts
 Warning: you cannot use CIME Classes in this module as it causes circular dependencies
 """
 import io, logging, gzip, sys, os, time, re, shutil, glob, string, random, imp, fnmatch
-import errno, signal, warnings, filecmp
+import errno, signal, warnings, filecmp, threading
 import stat as statlib
 import six
 from contextlib import contextmanager
@@ -205,10 +205,14 @@ def _read_cime_config_file():
     return cime_config
 
 _CIMECONFIG = None
+_CIMECONFIG_LOCK = threading.Lock()
 def get_cime_config():
     global _CIMECONFIG
-    if (not _CIMECONFIG):
-        _CIMECONFIG = _read_cime_config_file()
+    if _CIMECONFIG is None:
+        # Only take the lock on first use, TestScheduler threads may race here
+        with _CIMECONFIG_LOCK:
+            if _CIMECONFIG is None:
+                _CIMECONFIG = _read_cime_config_file()
 
     return _CIMECONFIG
 
@@ -1396,6 +1400,7 @@ def is_last_process_complete(filepath, expect_text, fail_text):
 
     return complete
 
+_directive_re = re.compile(r"{{ (\w+) }}", flags=re.M)
 def transform_vars(text, case=None, subgroup=None, overrides=None, default=None):
     """
     Do the variable substitution for any variables that need transforms
@@ -1408,30 +1413,34 @@ def transform_vars(text, case=None, subgroup=None, overrides=None, default=None)
     >>> transform_vars("I say {{ foo }}", overrides={"foo":"hi"})
     'I say hi'
     """
-    directive_re = re.compile(r"{{ (\w+) }}", flags=re.M)
+    debug = logger.isEnabledFor(logging.DEBUG)
     # loop through directive text, replacing each string enclosed with
     # template characters with the necessary values.
-    while directive_re.search(text):
-        m = directive_re.search(text)
+    while _directive_re.search(text):
+        m = _directive_re.search(text)
         variable = m.groups()[0]
         whole_match = m.group()
         if overrides is not None and variable.lower() in overrides and overrides[variable.lower()] is not None:
             repl = overrides[variable.lower()]
-            logger.debug("from overrides: in {}, replacing {} with {}".format(text, whole_match, str(repl)))
+            if debug:
+                logger.debug("from overrides: in {}, replacing {} with {}".format(text, whole_match, str(repl)))
             text = text.replace(whole_match, str(repl))
 
         elif case is not None and hasattr(case, variable.lower()) and getattr(case, variable.lower()) is not None:
             repl = getattr(case, variable.lower())
-            logger.debug("from case members: in {}, replacing {} with {}".format(text, whole_match, str(repl)))
+            if debug:
+                logger.debug("from case members: in {}, replacing {} with {}".format(text, whole_match, str(repl)))
             text = text.replace(whole_match, str(repl))
 
         elif case is not None and case.get_value(variable.upper(), subgroup=subgroup) is not None:
             repl = case.get_value(variable.upper(), subgroup=subgroup)
-            logger.debug("from case: in {}, replacing {} with {}".format(text, whole_match, str(repl)))
+            if debug:
+                logger.debug("from case: in {}, replacing {} with {}".format(text, whole_match, str(repl)))
             text = text.replace(whole_match, str(repl))
 
         elif default is not None:
-            logger.debug("from default: in {}, replacing {} with {}".format(text, whole_match, str(default)))
+            if debug:
+                logger.debug("from default: in {}, replacing {} with {}".format(text, whole_match, str(default)))
             text = text.replace(whole_match, default)
 
         else: